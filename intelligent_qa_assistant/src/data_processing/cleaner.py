@@ -1,33 +1,271 @@
 import re
+import string
+from typing import Callable, List, Optional
+
+# Optional PCRE2 binding; patterns are JIT-compiled to native code by default
+try:
+    import pcre2
+    PCRE2_AVAILABLE = True
+except ImportError:
+    PCRE2_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional Aho-Corasick automaton (pyahocorasick) for single-pass stopword removal
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Optional compiled batch cleaner (build with: cythonize -i cleaner_ext.pyx)
+try:
+    from .cleaner_ext import clean_batch as _ext_clean_batch
+    CLEANER_EXT_AVAILABLE = True
+except ImportError:
+    _ext_clean_batch = None
+    CLEANER_EXT_AVAILABLE = False
+
+try:
+    from ..utils.cache import disk_cached
+except ImportError:
+    # Outside the package (e.g. run as a script): no disk caching
+    def disk_cached(namespace, version):
+        return lambda method: method
+
+# Python's \s spelled out as an explicit class, since PCRE2's \s covers a different set of characters.
+_WS_PATTERN = '[\t-\r\x1c-\x20\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]+'
+
+# Precompiled patterns, using PCRE2-JIT when available and the re module otherwise.
+_regex_backend = pcre2 if PCRE2_AVAILABLE else re
+_WS_RE = _regex_backend.compile(_WS_PATTERN)
+_SPACE_RUN_RE = _regex_backend.compile(' {2,}')
+# PCRE2 encodes the subject as strict UTF-8, so text with lone surrogates (valid in str) is handled by re.
+_WS_RE_FALLBACK = re.compile(_WS_PATTERN)
+_SPACE_RUN_RE_FALLBACK = re.compile(' {2,}')
+
+
+def _sub_space(pattern, fallback, text: str) -> str:
+    """Replaces every match of pattern in text with a single space, using fallback if PCRE2 cannot encode text."""
+    try:
+        return pattern.sub(' ', text)
+    except UnicodeEncodeError:
+        return fallback.sub(' ', text)
+
+# Inputs shorter than this are cheaper to normalize with the re module than with NumPy.
+# PCRE2-JIT outperforms NumPy at every length, so the NumPy path is skipped when it is available.
+_NUMPY_WS_MIN_LENGTH = 4096
+# Inputs shorter than this are cheaper to filter with the translate table than with the NumPy bitmap.
+_NUMPY_FILTER_MIN_LENGTH = 128
+
+if NUMPY_AVAILABLE:
+    # Whitespace lookup over code points; the last whitespace code point is U+3000, so anything
+    # above it is clamped onto a trailing False entry.
+    _WS_MAX_CODEPOINT = 0x3000
+    _WS_LUT = np.array([chr(i).isspace() for i in range(_WS_MAX_CODEPOINT + 2)], dtype=np.bool_)
+
+
+def _normalize_whitespace_numpy(text: str) -> str:
+    """Vectorized equivalent of _WS_RE.sub(' ', text).strip() over UTF-32 code points."""
+    # surrogatepass: lone surrogates are valid in str and must round-trip like on the regex path
+    codepoints = np.frombuffer(text.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    is_ws = _WS_LUT[np.minimum(codepoints, _WS_MAX_CODEPOINT + 1)]
+    # Keep every non-whitespace character and the first character of each whitespace run.
+    keep = ~is_ws
+    keep[1:] |= is_ws[1:] & ~is_ws[:-1]
+    keep[0] |= is_ws[0]
+    out = np.where(is_ws, np.uint32(ord(' ')), codepoints)[keep]
+    return out.tobytes().decode('utf-32-le', 'surrogatepass').strip()
+
+# Characters kept when removing special characters: lowercase letters, numbers and basic punctuation (.,?!').
+# Whitespace is kept as well (see _CleanTable.__missing__).
+_KEEP = frozenset(string.ascii_lowercase + string.digits + ".,?!'")
+
+# Additionally kept by clean_multilingual: CJK unified ideographs (U+4E00-U+9FA5) and common CJK punctuation.
+_CJK_FIRST, _CJK_LAST = 0x4E00, 0x9FA5
+_CJK_PUNCTUATION = frozenset("，。？！；：‘“’”《》")
+
+
+def _is_multilingual_keep(char: str) -> bool:
+    return char in _KEEP or char in _CJK_PUNCTUATION or _CJK_FIRST <= ord(char) <= _CJK_LAST
+
+
+class _CleanTable(dict):
+    """
+    str.translate table that maps all whitespace to a single space and, if keep is given,
+    lowercases and deletes every character for which keep(char) is false.
+
+    Without keep, characters are not lowercased: the caller applies str.lower() to the whole
+    text, since lowercasing can depend on context (e.g. the Greek final sigma).
+
+    A full table over all 0x110000 code points would cost tens of MB, so entries are
+    filled in lazily the first time a code point is seen. Deleted characters map to None rather
+    than '', since any other value takes str.translate off its fast path for ASCII text.
+    """
+
+    def __init__(self, keep: Optional[Callable[[str], bool]] = None):
+        super().__init__()
+        self.keep = keep
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        if char.isspace():
+            value = ' '
+        elif self.keep is None:
+            value = char
+        else:
+            value = ''.join(c for c in char.lower() if self.keep(c)) or None
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable(keep=_KEEP.__contains__)
+_LOWER_TABLE = _CleanTable()
+_MULTILINGUAL_TABLE = _CleanTable(keep=_is_multilingual_keep)
+
+if NUMPY_AVAILABLE:
+    # Bitmap over all code points (1.1 MB) of characters kept by clean_multilingual, including whitespace.
+    _MULTILINGUAL_ALLOW = np.zeros(0x110000, dtype=np.bool_)
+    _MULTILINGUAL_ALLOW[[ord(c) for c in _KEEP | _CJK_PUNCTUATION]] = True
+    _MULTILINGUAL_ALLOW[_CJK_FIRST:_CJK_LAST + 1] = True
+    _MULTILINGUAL_ALLOW[:len(_WS_LUT) - 1] |= _WS_LUT[:-1]
+
+
+def _filter_multilingual_numpy(text: str) -> str:
+    """Lowercases text and drops the characters clean_multilingual removes, with one bitmap lookup per code point."""
+    # surrogatepass: lone surrogates are valid in str; the bitmap drops them like the translate table does
+    codepoints = np.frombuffer(text.lower().encode('utf-32-le', 'surrogatepass'), dtype=np.uint32)
+    return codepoints[_MULTILINGUAL_ALLOW[codepoints]].tobytes().decode('utf-32-le')
+
+
+def _clean_fused(text: str, table: _CleanTable) -> str:
+    """Lowercases, filters and maps whitespace in one translate pass, then collapses runs of spaces."""
+    if table.keep is None:
+        text = text.lower()
+    return _sub_space(_SPACE_RUN_RE, _SPACE_RUN_RE_FALLBACK, text.translate(table)).strip(' ')
+
+
+def _is_word_char(char: str) -> bool:
+    """
+    Same notion of a word character as the regex [\\w'] class. The cleaner keeps apostrophes,
+    so they belong to the word ("it's" must not match the stopword "it").
+    """
+    return char.isalnum() or char == '_' or char == "'"
 
 class TextCleaner:
     """A class for cleaning text data."""
 
-    def __init__(self, remove_special_chars: bool = True):
+    def __init__(self, remove_special_chars: bool = True, stopwords: Optional[List[str]] = None):
         """
         Initializes the TextCleaner.
 
         Args:
             remove_special_chars (bool): Whether to remove special characters.
+            stopwords (Optional[List[str]]): Words or phrases to remove from the cleaned text. They are
+                cleaned the same way as the text and only removed where they form whole words.
         """
         self.remove_special_chars = remove_special_chars
+        self._table = _CLEAN_TABLE if remove_special_chars else _LOWER_TABLE
+        self.stopwords = list(stopwords) if stopwords else []
+        self._stopword_matcher = self._build_stopword_matcher(self.stopwords)
 
-    def clean_text(self, text: str) -> str:
-        """Basic text cleaning: lowercase, remove extra whitespace, and optionally remove special characters."""
-        text = text.lower()
-        text = self.normalize_whitespace(text)
+    def _build_stopword_matcher(self, stopwords: List[str]):
+        """
+        Builds an Aho-Corasick automaton over the cleaned stopwords, matching all of them in one pass
+        regardless of how many there are. Falls back to a single regex alternation without pyahocorasick.
+        """
+        patterns = {_clean_fused(word, self._table) for word in stopwords} - {''}
+        if not patterns:
+            return None
+        if AHOCORASICK_AVAILABLE:
+            automaton = ahocorasick.Automaton()
+            for pattern in patterns:
+                automaton.add_word(pattern, len(pattern))
+            automaton.make_automaton()
+            return automaton
+        # Longest patterns first so that phrases win over their prefixes
+        alternation = '|'.join(re.escape(pattern) for pattern in sorted(patterns, key=len, reverse=True))
+        return re.compile(rf"(?<![\w'])(?:{alternation})(?![\w'])")
 
-        if self.remove_special_chars:
-            # Using double quotes for the raw string to avoid issues with the single quote inside.
-            # This regex aims to keep lowercase letters, numbers, whitespace, and basic punctuation (.,?!')
-            # It will remove other special characters.
-            text = re.sub(r"[^a-z0-9\s.,?!']", '', text)
+    def _remove_stopwords(self, text: str) -> str:
+        """Removes whole-word stopword matches from cleaned text and collapses the spaces left behind."""
+        if not AHOCORASICK_AVAILABLE:
+            text = self._stopword_matcher.sub('', text)
+        else:
+            text_len = len(text)
+            spans = []
+            for end, length in self._stopword_matcher.iter(text):
+                start = end - length + 1
+                if start > 0 and _is_word_char(text[start - 1]):
+                    continue
+                if end + 1 < text_len and _is_word_char(text[end + 1]):
+                    continue
+                spans.append((start, end + 1))
+            if not spans:
+                return text
+            # Keep the leftmost-longest non-overlapping matches, as the regex fallback does
+            spans.sort(key=lambda span: (span[0], -span[1]))
+            parts = []
+            pos = 0
+            for start, end in spans:
+                if start < pos:
+                    continue
+                parts.append(text[pos:start])
+                pos = end
+            parts.append(text[pos:])
+            text = ''.join(parts)
+        return _sub_space(_SPACE_RUN_RE, _SPACE_RUN_RE_FALLBACK, text).strip(' ')
 
+    def _cache_params(self) -> tuple:
+        """Parameters that affect clean_text output, for the disk cache key."""
+        return (self.remove_special_chars, tuple(sorted(set(self.stopwords))))
+
+    @disk_cached("cleaner", version=1)
+    def clean_text(self, text: str) -> str:
+        """Basic text cleaning: lowercase, remove extra whitespace, optionally remove special characters and stopwords."""
+        # Special characters (everything except lowercase letters, numbers, whitespace, and basic
+        # punctuation .,?!') are removed before whitespace is collapsed, so no double spaces are left behind.
+        text = _clean_fused(text, self._table)
+        if self._stopword_matcher is not None:
+            text = self._remove_stopwords(text)
         return text
 
+    def clean_batch(self, texts: List[str]) -> List[str]:
+        """
+        Cleans a list of texts, using the compiled extension when it is available.
+
+        Args:
+            texts (List[str]): The texts to clean.
+
+        Returns:
+            List[str]: The cleaned texts, in the same order.
+        """
+        # The extension only implements the ASCII output of special-character removal.
+        if self.remove_special_chars and CLEANER_EXT_AVAILABLE:
+            cleaned = _ext_clean_batch(list(texts))
+            if self._stopword_matcher is not None:
+                cleaned = [self._remove_stopwords(text) for text in cleaned]
+            return cleaned
+        return [self.clean_text(text) for text in texts]
+
+    def clean_multilingual(self, text: str) -> str:
+        """
+        Like clean_text with special-character removal, but also keeps CJK ideographs and CJK punctuation
+        (，。？！；：‘“’”《》). Stopwords are not applied.
+        """
+        if NUMPY_AVAILABLE and len(text) >= _NUMPY_FILTER_MIN_LENGTH:
+            return self.normalize_whitespace(_filter_multilingual_numpy(text))
+        return _clean_fused(text, _MULTILINGUAL_TABLE)
+
     def normalize_whitespace(self, text: str) -> str:
         """Replaces multiple whitespace characters with a single space and trims leading/trailing whitespace."""
-        text = re.sub(r'\s+', ' ', text).strip()
+        if NUMPY_AVAILABLE and not PCRE2_AVAILABLE and len(text) >= _NUMPY_WS_MIN_LENGTH:
+            return _normalize_whitespace_numpy(text)
+        text = _sub_space(_WS_RE, _WS_RE_FALLBACK, text).strip()
         return text
 
 # Example Usage (optional, for testing)
@@ -45,15 +283,12 @@ if __name__ == '__main__':
     cleaned_text2 = cleaner_keep_special.clean_text(sample_text_with_special_chars)
     print(f"Cleaned (keep special): '{cleaned_text2}'")
 
-    # Note: The current regex r"[^a-z0-9\s.,?!']" will remove Chinese characters.
-    # If you need to support Chinese, the regex needs to be adjusted.
-    # For example, to keep Chinese characters, English letters, numbers, and basic English punctuation:
-    # cleaner_chinese = TextCleaner()
-    # cleaner_chinese.clean_text = lambda t: re.sub(r'[^\u4e00-\u9fa5a-zA-Z0-9\s.,?!\'']', '', t.lower())
-    # cleaned_chinese_text = cleaner_chinese.clean_text(sample_text_chinese)
-    # print(f"Original Chinese: '{sample_text_chinese}'")
-    # print(f"Cleaned Chinese: '{cleaned_chinese_text}'")
-
-    # A more robust regex for CJK and basic English might be:
-    # text = re.sub(r"[^\u4e00-\u9fa5a-zA-Z0-9\s.,?!'，。？！；：‘“’”《》]", '', text)
-    # This would require careful consideration of which punctuation to keep.
\ No newline at end of file
+    cleaner_stopwords = TextCleaner(stopwords=["how are you", "is", "it"])
+    cleaned_text3 = cleaner_stopwords.clean_text(sample_text_with_special_chars)
+    print(f"Cleaned (stopwords removed): '{cleaned_text3}'")
+
+    # Note: The special-character filter of clean_text (see _KEEP) will remove Chinese characters.
+    # clean_multilingual keeps CJK ideographs, English letters, numbers, and basic English and CJK punctuation.
+    cleaned_chinese_text = cleaner_default.clean_multilingual(sample_text_chinese)
+    print(f"Original Chinese: '{sample_text_chinese}'")
+    print(f"Cleaned Chinese: '{cleaned_chinese_text}'")
@@ -0,0 +1,84 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Optional compiled fast path for TextCleaner.clean_batch.
+
+Build in place with:
+    cythonize -i cleaner_ext.pyx
+
+If the extension is not built, TextCleaner falls back to the pure Python implementation.
+"""
+from cpython.unicode cimport (
+    PyUnicode_DATA,
+    PyUnicode_GET_LENGTH,
+    PyUnicode_KIND,
+    PyUnicode_READ,
+    Py_UNICODE_ISSPACE,
+    Py_UNICODE_TOLOWER,
+)
+from libc.stdlib cimport free, malloc
+
+# 1 for ASCII characters kept when removing special characters: lowercase letters, numbers and .,?!'
+cdef unsigned char _KEEP[128]
+
+
+cdef void _init_keep_table():
+    cdef int i
+    for i in range(128):
+        _KEEP[i] = 0
+    for i in range(ord('a'), ord('z') + 1):
+        _KEEP[i] = 1
+    for i in range(ord('0'), ord('9') + 1):
+        _KEEP[i] = 1
+    for c in b".,?!'":
+        _KEEP[c] = 1
+
+
+_init_keep_table()
+
+
+cdef str _clean_one(str text):
+    """Lowercase, drop special characters and collapse whitespace in a single loop."""
+    cdef Py_ssize_t n, i, length = 0
+    cdef int kind
+    cdef void *data
+    cdef char *out
+    cdef Py_UCS4 ch
+    cdef bint pending_space = False
+
+    # A typed str argument still accepts None, which must not reach the PyUnicode_* accessors.
+    if text is None:
+        raise TypeError("clean_batch() expects str items, got None")
+    n = PyUnicode_GET_LENGTH(text)
+    kind = PyUnicode_KIND(text)
+    data = PyUnicode_DATA(text)
+
+    if n == 0:
+        return ''
+
+    # Output is pure ASCII and never longer than the input.
+    out = <char *> malloc(n)
+    if out == NULL:
+        raise MemoryError()
+    try:
+        for i in range(n):
+            ch = PyUnicode_READ(kind, data, i)
+            if Py_UNICODE_ISSPACE(ch):
+                pending_space = True
+                continue
+            ch = Py_UNICODE_TOLOWER(ch)
+            if ch >= 128 or not _KEEP[ch]:
+                continue
+            if pending_space and length > 0:
+                out[length] = b' '
+                length += 1
+            pending_space = False
+            out[length] = <char> ch
+            length += 1
+        return out[:length].decode('ascii')
+    finally:
+        free(out)
+
+
+def clean_batch(list texts) -> list:
+    """Cleans each string in texts with special-character removal enabled; returns a new list."""
+    return [_clean_one(text) for text in texts]
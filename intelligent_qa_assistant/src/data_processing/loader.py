@@ -1,4 +1,5 @@
 import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Any, Optional
 
 # 第三方库，用于PDF文本提取
@@ -10,12 +11,40 @@ except ImportError:
     PYMUPDF_AVAILABLE = False
     print("Warning: PyMuPDF (fitz) not installed. PDF text extraction will be limited.")
 
+try:
+    from ..utils.cache import get_cache
+except ImportError:
+    # 不在包内 (例如直接作为脚本运行) 时不使用磁盘缓存
+    def get_cache(namespace):
+        return None
+
+# 超过该大小 (字节) 的TXT文件在读取前提示内核顺序预读
+_FADVISE_MIN_SIZE = 1024 * 1024
+
+# 每个工作进程复用一个 DocumentLoader 实例 (见 _load_one)
+_worker_loader = None
+
+def _load_one(file_path: str) -> str:
+    """在工作进程中加载单个文档。定义在模块级别以便被 pickle。"""
+    global _worker_loader
+    if _worker_loader is None:
+        _worker_loader = DocumentLoader()
+    return _worker_loader.load_document(file_path)
+
 class DocumentLoader:
     """加载不同格式的文档并提取文本内容 (不含OCR功能)"""
 
     def __init__(self):
         """初始化文档加载器。"""
-        pass # 目前不需要特殊初始化
+        # 扩展名 -> 处理函数，load_document 每次调用只需一次字典查找
+        self._handlers = {
+            '.txt': self._load_txt,
+            '.md': self._load_markdown, # Markdown可以视为纯文本加载
+            '.pdf': self._load_pdf,
+            # 可以根据需要添加对 .doc, .docx 等格式的支持 (需要相应库)
+            # '.docx': self._load_docx, # 需要 python-docx
+            **{ext: self._unsupported_image for ext in ('.jpg', '.jpeg', '.png', '.bmp', '.tiff')},
+        }
 
     def load_document(self, file_path: str) -> str:
         """
@@ -35,32 +64,56 @@ class DocumentLoader:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"文件未找到: {file_path}")
 
-        _, file_extension = os.path.splitext(file_path.lower())
-
-        if file_extension == '.txt':
-            return self._load_txt(file_path)
-        elif file_extension == '.md':
-            return self._load_markdown(file_path) # Markdown可以视为纯文本加载
-        elif file_extension == '.pdf':
-            return self._load_pdf(file_path)
-        elif file_extension in ['.jpg', '.jpeg', '.png', '.bmp', '.tiff']:
-            return "[不支持处理图片文件，因为OCR功能未启用]"
-        # 可以根据需要添加对 .doc, .docx 等格式的支持 (需要相应库)
-        # elif file_extension == '.docx':
-        #     return self._load_docx(file_path) # 需要 python-docx
-        else:
-            # 对于其他未知类型，可以尝试作为文本读取，或直接标记为不支持
-            # raise ValueError(f"不支持的文件类型: {file_extension}")
-            print(f"警告: 未知文件类型 {file_extension}，将尝试作为纯文本读取。")
-            try:
-                return self._load_txt(file_path) # 尝试作为文本文件处理
-            except Exception as e:
-                return f"[无法处理文件类型 {file_extension}: {e}]"
+        file_extension = os.path.splitext(file_path)[1].lower()
+        handler = self._handlers.get(file_extension, self._load_txt_fallback)
+        return handler(file_path)
+
+    def load_many(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[str]:
+        """
+        使用进程池并行加载多个文档，PDF解析等CPU密集型工作可随核数扩展。
+
+        Args:
+            file_paths (List[str]): 文档路径列表。
+            max_workers (Optional[int]): 工作进程数，默认为CPU核数。
+
+        Returns:
+            List[str]: 与 file_paths 顺序一致的文本内容列表。
+
+        Raises:
+            FileNotFoundError: 如果任一文件未找到。
+        """
+        if not file_paths:
+            return []
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(_load_one, file_paths, chunksize=4))
+
+    def _unsupported_image(self, file_path: str) -> str:
+        """图片文件：OCR功能未启用，返回提示"""
+        return "[不支持处理图片文件，因为OCR功能未启用]"
+
+    def _load_txt_fallback(self, file_path: str) -> str:
+        """未知文件类型：尝试作为纯文本读取"""
+        file_extension = os.path.splitext(file_path)[1].lower()
+        # 对于其他未知类型，可以尝试作为文本读取，或直接标记为不支持
+        # raise ValueError(f"不支持的文件类型: {file_extension}")
+        print(f"警告: 未知文件类型 {file_extension}，将尝试作为纯文本读取。")
+        try:
+            return self._load_txt(file_path) # 尝试作为文本文件处理
+        except Exception as e:
+            return f"[无法处理文件类型 {file_extension}: {e}]"
 
     def _load_txt(self, file_path: str) -> str:
         """加载TXT文件"""
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            return f.read()
+        # 以二进制一次性读取后整体解码，跳过 TextIOWrapper 的缓冲与增量解码开销
+        with open(file_path, 'rb') as f:
+            if hasattr(os, 'posix_fadvise') and os.fstat(f.fileno()).st_size > _FADVISE_MIN_SIZE:
+                # 大文件提示内核顺序读取，加大预读
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            text = f.read().decode('utf-8', errors='ignore')
+        # 与文本模式的通用换行行为保持一致
+        if '\r' in text:
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
 
     def _load_markdown(self, file_path: str) -> str:
         """加载Markdown文件 (作为纯文本)"""
@@ -71,21 +124,40 @@ class DocumentLoader:
         加载PDF文件，尝试提取内嵌文本。
         如果PDF是扫描件或无法提取文本，则返回提示。
         """
-        text_content = ""
         if PYMUPDF_AVAILABLE:
+            # 以 (路径, 修改时间, 大小) 为键缓存提取结果，未变化的PDF不再重复解析
+            # 缓存只用于加速：读写缓存失败时忽略，不影响PDF解析结果
+            cache, cache_key, text_content = None, None, None
             try:
-                doc = fitz.open(file_path)
-                for page_num in range(len(doc)):
-                    page = doc.load_page(page_num)
-                    text_content += page.get_text()
-                doc.close()
-                if text_content.strip(): # 如果提取到文本
-                    return text_content
-                else:
-                    return "[PDF中未找到可选中文本，可能为扫描件或图片PDF，OCR功能未启用]"
-            except Exception as e:
-                print(f"使用PyMuPDF提取PDF文本时出错: {e}")
-                return f"[处理PDF时出错: {e}，OCR功能未启用]"
+                cache = get_cache("pdf_text")
+                if cache is not None:
+                    stat = os.stat(file_path)
+                    cache_key = f"{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}"
+                    text_content = cache.get(cache_key)
+            except Exception:
+                cache = None
+
+            if text_content is None:
+                try:
+                    # 按路径打开时 MuPDF 直接从文件按需读取，不会把整个PDF读入Python内存
+                    # 先收集每页文本再一次性 join，避免 += 拼接在长PDF上的 O(n²) 开销
+                    # sort=False: 跳过 PyMuPDF 的阅读顺序排序，下游分块不依赖该顺序
+                    with fitz.open(file_path) as doc:
+                        parts = [page.get_text("text", sort=False) for page in doc]
+                    text_content = "".join(parts)
+                except Exception as e:
+                    print(f"使用PyMuPDF提取PDF文本时出错: {e}")
+                    return f"[处理PDF时出错: {e}，OCR功能未启用]"
+                if cache is not None:
+                    try:
+                        cache.set(cache_key, text_content)
+                    except Exception:
+                        pass
+
+            if text_content.strip(): # 如果提取到文本
+                return text_content
+            else:
+                return "[PDF中未找到可选中文本，可能为扫描件或图片PDF，OCR功能未启用]"
         else:
             return "[无法处理PDF文件：PyMuPDF (fitz) 库未安装，OCR功能未启用]"
 
@@ -1,8 +1,34 @@
-from typing import List, Callable
+from typing import List, Callable, Optional, Tuple
+
+try:
+    from ..utils.cache import disk_cached
+except ImportError:
+    # Outside the package (e.g. run as a script): no disk caching
+    def disk_cached(namespace, version):
+        return lambda method: method
 
 # A simple text splitter function, can be replaced with more sophisticated ones
 # from libraries like Langchain or NLTK if needed.
 
+def _fixed_size_starts(text_len: int, chunk_size: int, chunk_overlap: int) -> range:
+    """
+    Validates the chunking parameters and returns the start offsets of fixed-size chunks.
+
+    Chunk starts advance by (chunk_size - chunk_overlap). The last chunk is the first one that
+    reaches the end of the text, i.e. every start lies below text_len - chunk_overlap
+    (the first chunk is always produced, even for text shorter than the overlap).
+    """
+    if chunk_size <= 0:
+        raise ValueError("Chunk size must be positive.")
+    if chunk_overlap < 0:
+        raise ValueError("Chunk overlap cannot be negative.")
+    if chunk_overlap >= chunk_size:
+        raise ValueError("Chunk overlap should be less than chunk size.")
+
+    stride = chunk_size - chunk_overlap
+    return range(0, max(text_len - chunk_overlap, 1), stride)
+
+
 def split_text_by_fixed_size(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
     """
     Splits text into chunks of a fixed size with a specified overlap.
@@ -17,41 +43,83 @@ def split_text_by_fixed_size(text: str, chunk_size: int, chunk_overlap: int) ->
     """
     if not isinstance(text, str) or not text:
         return []
-    if chunk_size <= 0:
-        raise ValueError("Chunk size must be positive.")
-    if chunk_overlap < 0:
-        raise ValueError("Chunk overlap cannot be negative.")
-    if chunk_overlap >= chunk_size:
-        raise ValueError("Chunk overlap should be less than chunk size.")
+    starts = _fixed_size_starts(len(text), chunk_size, chunk_overlap)
+    return [text[start:start + chunk_size] for start in starts]
+
+
+# Characters a chunk boundary may be moved to, and how far (in characters) it may move.
+_BOUNDARY_CHARS = ' \n\t'
+_BOUNDARY_WINDOW = 64
+
+
+def _rfind_boundary(text: str, lo: int, hi: int) -> int:
+    """Returns the index of the last boundary character in text[lo:hi], or -1 if there is none."""
+    # str.rfind scans in C, which for a short window is cheaper than any call into native helpers.
+    return max(text.rfind(char, lo, hi) for char in _BOUNDARY_CHARS)
+
+
+def _word_boundary_bounds(text: str, chunk_size: int, chunk_overlap: int) -> List[Tuple[int, int]]:
+    """
+    Returns (start, end) character offsets of chunks whose edges are moved back to whitespace.
+
+    Each cut point produced by the fixed-size algorithm is moved back to the nearest whitespace at
+    most _BOUNDARY_WINDOW characters away, so chunks never exceed chunk_size and overlap by at least
+    chunk_overlap. Where no whitespace is in reach (e.g. CJK text) the fixed-size cut is kept.
+    """
+    # Validates the parameters
+    _fixed_size_starts(len(text), chunk_size, chunk_overlap)
 
-    chunks = []
-    start_index = 0
     text_len = len(text)
+    stride = chunk_size - chunk_overlap
+    # Both edges may move back by the window, so it must stay below half the stride to guarantee progress.
+    window = min(_BOUNDARY_WINDOW, (stride - 1) // 2)
+    bounds = []
+    start = 0
+    while True:
+        end = start + chunk_size
+        if end >= text_len:
+            bounds.append((start, text_len))
+            return bounds
+        # A whitespace at text[end] itself is a clean cut as well.
+        cut = _rfind_boundary(text, max(start + 1, end - window), end + 1)
+        if cut != -1:
+            end = cut
+        bounds.append((start, end))
+
+        next_start = end - chunk_overlap
+        cut = _rfind_boundary(text, max(start + 1, next_start - window), next_start)
+        start = cut + 1 if cut != -1 else next_start
 
-    while start_index < text_len:
-        end_index = min(start_index + chunk_size, text_len)
-        chunks.append(text[start_index:end_index])
-        
-        # Move to the next chunk start position
-        # If we are at the end of the text, no need to advance further for overlap
-        if end_index == text_len:
-            break
-        
-        start_index += (chunk_size - chunk_overlap)
-        
-        # Ensure we don't create an empty chunk due to overlap logic at the very end
-        if start_index >= text_len and chunks[-1] != text[text_len-chunk_size if text_len-chunk_size > 0 else 0:] :
-             # This condition is a bit complex, aims to avoid re-adding the last part if overlap makes it so
-             pass # Or handle potential edge cases more gracefully
-
-    # A simpler loop structure might be preferred for clarity, e.g.:
-    # for i in range(0, len(text), chunk_size - chunk_overlap):
-    #     chunks.append(text[i:i + chunk_size])
-    # The above simpler loop might create chunks that are smaller than chunk_size at the end,
-    # and the last chunk might be identical to the previous one if overlap is large.
-    # The current while loop tries to ensure chunks are mostly of chunk_size.
-
-    return chunks
+
+def split_text_by_word_boundary(text: str, chunk_size: int, chunk_overlap: int) -> List[str]:
+    """
+    Splits text into chunks of at most chunk_size characters, cutting at whitespace where possible.
+
+    Args:
+        text: The input text to split.
+        chunk_size: The maximum size of each chunk (e.g., number of characters).
+        chunk_overlap: The minimum number of characters to overlap between consecutive chunks.
+
+    Returns:
+        A list of text chunks.
+    """
+    if not isinstance(text, str) or not text:
+        return []
+    return [text[start:end] for start, end in _word_boundary_bounds(text, chunk_size, chunk_overlap)]
+
+
+def _fixed_size_bounds(text: str, chunk_size: int, chunk_overlap: int) -> List[Tuple[int, int]]:
+    """Returns (start, end) character offsets of the chunks produced by split_text_by_fixed_size."""
+    text_len = len(text)
+    starts = _fixed_size_starts(text_len, chunk_size, chunk_overlap)
+    return [(start, min(start + chunk_size, text_len)) for start in starts]
+
+
+# Built-in splitters whose chunks can be expressed as offsets (used by structure_text_views)
+_SPLITTER_BOUNDS = {
+    split_text_by_fixed_size: _fixed_size_bounds,
+    split_text_by_word_boundary: _word_boundary_bounds,
+}
 
 
 class TextStructurizer:
@@ -67,12 +135,19 @@ class TextStructurizer:
         Args:
             chunk_size: Default size of text chunks.
             chunk_overlap: Default overlap between chunks.
-            splitter_fn: A custom function to split text. If None, uses split_text_by_fixed_size.
+            splitter_fn: A custom function to split text. If None, uses split_text_by_word_boundary.
         """
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.splitter_fn = splitter_fn if splitter_fn else split_text_by_fixed_size
+        self.splitter_fn = splitter_fn if splitter_fn else split_text_by_word_boundary
 
+    def _cache_params(self) -> Optional[tuple]:
+        """Parameters that affect structure_text output, for the disk cache key; None for custom splitters."""
+        if self.splitter_fn not in _SPLITTER_BOUNDS:
+            return None
+        return (self.chunk_size, self.chunk_overlap, self.splitter_fn.__name__)
+
+    @disk_cached("structurizer", version=1)
     def structure_text(self, text: str) -> List[str]:
         """
         Splits the given text into structured chunks.
@@ -87,12 +162,48 @@ class TextStructurizer:
             return []
         return self.splitter_fn(text, self.chunk_size, self.chunk_overlap)
 
+    def structure_text_views(self, text: str) -> List[memoryview]:
+        """
+        Splits the given text into chunks returned as memoryviews over a single UTF-8 buffer.
+
+        The chunk bodies are not copied; callers decode them lazily with bytes(view).decode('utf-8').
+        Only the built-in splitters can be expressed as views; with a custom splitter_fn each chunk
+        is encoded separately.
+
+        Args:
+            text: The text to be structured.
+
+        Returns:
+            A list of memoryviews, one per chunk, in the same order as structure_text.
+        """
+        if not text:
+            return []
+        bounds_fn = _SPLITTER_BOUNDS.get(self.splitter_fn)
+        if bounds_fn is None:
+            return [memoryview(chunk.encode('utf-8')) for chunk in self.structure_text(text)]
+
+        bounds = bounds_fn(text, self.chunk_size, self.chunk_overlap)
+        buf = memoryview(text.encode('utf-8'))
+        if len(buf) == len(text):
+            # ASCII: character offsets are byte offsets
+            return [buf[start:end] for start, end in bounds]
+
+        # Map each chunk boundary from a character offset to a byte offset, walking the boundaries
+        # in order and encoding only the gap between consecutive ones.
+        byte_offsets = {0: 0}
+        prev_char = prev_byte = 0
+        for char_offset in sorted({offset for bound in bounds for offset in bound}):
+            prev_byte += len(text[prev_char:char_offset].encode('utf-8'))
+            prev_char = char_offset
+            byte_offsets[char_offset] = prev_byte
+        return [buf[byte_offsets[start]:byte_offsets[end]] for start, end in bounds]
+
 # Example Usage:
 if __name__ == '__main__':
     sample_long_text = (
         "This is a very long string that needs to be split into smaller chunks. "
         "The splitting should ideally happen at sensible points, but for this basic example, "
-        "we will use a fixed-size chunking mechanism. This mechanism will take a chunk size "
+        "we will use a size-based chunking mechanism. This mechanism will take a chunk size "
         "and an overlap size as parameters. The overlap is important to maintain context "
         "between chunks, which can be crucial for the performance of RAG systems. "
         "Let's imagine this text continues for many more sentences, detailing various aspects "
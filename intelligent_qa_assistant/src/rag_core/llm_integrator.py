@@ -1,11 +1,53 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import asyncio
 import json
 import os
-from typing import Optional, Dict, Any
+import threading
+import weakref
+from typing import Optional, Dict, Any, Iterator, List, Tuple
+
+# orjson is optional; it serializes straight to bytes and is several times faster than json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serializes obj to UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
+# httpx is optional; it is only needed for the async API (generate_answer_async / generate_answers_batch)
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# HTTP/2 in httpx requires the h2 package
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
 
 class LLMIntegrator:
     """Handles interaction with a Large Language Model API."""
 
+    # Shared async clients, one per event loop, created lazily. httpx clients are bound to the loop
+    # they are used on, so threads running their own loops each get their own client.
+    # Await LLMIntegrator.aclose() before a loop ends (e.g. inside asyncio.run()) to close its client.
+    _async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+    _async_clients_lock = threading.Lock()
+
     def __init__(self, api_base_url: Optional[str] = None, api_key: Optional[str] = None, model_name: str = "deepseek-r1"):
         """
         Initializes the LLMIntegrator.
@@ -38,6 +80,30 @@ class LLMIntegrator:
         if self.api_key:
              self.headers["Authorization"] = f"Bearer {self.api_key}"
 
+        # Reuse TCP/TLS connections across calls instead of opening a new one per request.
+        # Retries cover connection failures; POST requests are not re-sent once the server has received them.
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        self._api_endpoint = f"{self.api_base_url.rstrip('/')}/v1/chat/completions" # Common endpoint for chat models
+        # Or for completions: f"{self.api_base_url.rstrip('/')}/v1/completions"
+
+        # Parts of the request body that do not depend on the query, built once.
+        # The exact structure (e.g., 'prompt' vs 'messages', parameters)
+        # depends heavily on the DeepSeek-R1 API specification.
+        # This is a common payload structure for chat-like models:
+        self._system_msg = {"role": "system", "content": "You are an intelligent assistant. Provide answers based on the given context."}
+        self._base_payload = {
+            "model": self.model_name,
+            # Tokens are delivered as server-sent events so callers can show them as they arrive.
+            "stream": True,
+            # Add other parameters as supported by DeepSeek-R1 API, e.g., top_p, etc.
+        }
+
         print(f"LLMIntegrator initialized for model '{self.model_name}' at URL '{self.api_base_url}'")
 
     def generate_answer(self, query: str, context: str, max_tokens: int = 500, temperature: float = 0.7) -> Optional[str]:
@@ -57,74 +123,236 @@ class LLMIntegrator:
             print("API URL not configured.")
             return None
 
-        # Construct the prompt. This structure is common but might need adjustment
-        # based on how DeepSeek-R1 expects prompts for RAG.
-        prompt = f"You are an intelligent assistant. Based on the following context, please answer the user's question. If the context does not contain the answer, say so.\n\nContext:\n{context}\n\nQuestion: {query}\n\nAnswer:"
-        
-        # Define the payload for the API request.
-        # The exact structure (e.g., 'prompt' vs 'messages', parameters) 
-        # depends heavily on the DeepSeek-R1 API specification.
-        # This is a common payload structure for chat-like models:
-        payload = {
-            "model": self.model_name,
-            "messages": [
-                {"role": "system", "content": "You are an intelligent assistant. Provide answers based on the given context."},
-                {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {query}"}
-            ],
+        try:
+            answer = "".join(self._stream_tokens(query, context, max_tokens, temperature)).strip()
+            if answer:
+                return answer
+            print("Could not extract answer from LLM response.")
+            return "Sorry, I received a response but could not extract an answer."
+        except requests.exceptions.RequestException as e:
+            self._log_request_error(e)
+            return "Sorry, I encountered an error while trying to reach the language model."
+        except Exception as e:
+            print(f"An unexpected error occurred during LLM call: {e}")
+            return "Sorry, an unexpected error occurred while processing your request with the language model."
+
+    def generate_answer_stream(self, query: str, context: str, max_tokens: int = 500, temperature: float = 0.7) -> Iterator[str]:
+        """
+        Generates an answer from the LLM, yielding text fragments as the model produces them.
+
+        Args:
+            query: The user's original query.
+            context: The retrieved context from the vector store.
+            max_tokens: Maximum number of tokens for the generated answer.
+            temperature: Sampling temperature for generation (0.0 to 1.0+).
+
+        Yields:
+            Fragments of the generated answer. On error, an apology message is yielded instead.
+        """
+        if not self.api_base_url:
+            print("API URL not configured.")
+            return
+
+        try:
+            yield from self._stream_tokens(query, context, max_tokens, temperature)
+        except requests.exceptions.RequestException as e:
+            self._log_request_error(e)
+            yield "Sorry, I encountered an error while trying to reach the language model."
+        except Exception as e:
+            print(f"An unexpected error occurred during LLM call: {e}")
+            yield "Sorry, an unexpected error occurred while processing your request with the language model."
+
+    def _build_payload(self, query: str, context: str, max_tokens: int, temperature: float) -> bytes:
+        """Builds the serialized chat completion request body."""
+        user_msg = {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {query}"}
+        return _json_dumps({
+            **self._base_payload,
+            "messages": [self._system_msg, user_msg],
             "max_tokens": max_tokens,
             "temperature": temperature,
-            # Add other parameters as supported by DeepSeek-R1 API, e.g., top_p, stream, etc.
-        }
+        })
 
-        # Example for a completion-style API (if DeepSeek-R1 uses this):
-        # payload_completion_style = {
-        #     "model": self.model_name,
-        #     "prompt": prompt,
-        #     "max_tokens": max_tokens,
-        #     "temperature": temperature,
-        # }
-        # current_payload = payload # or payload_completion_style, depending on API
-        current_payload = payload
-
-        api_endpoint = f"{self.api_base_url.rstrip('/')}/v1/chat/completions" # Common endpoint for chat models
-        # Or for completions: f"{self.api_base_url.rstrip('/')}/v1/completions"
+    def _stream_tokens(self, query: str, context: str, max_tokens: int, temperature: float) -> Iterator[str]:
+        """Sends a streaming request and yields content fragments. Request errors are raised to the caller."""
+        payload = self._build_payload(query, context, max_tokens, temperature)
 
-        print(f"Sending request to LLM: {api_endpoint} with model {self.model_name}")
-        # print(f"Payload: {json.dumps(current_payload, indent=2)}") # For debugging
+        print(f"Sending request to LLM: {self._api_endpoint} with model {self.model_name}")
+        # print(f"Payload: {payload.decode('utf-8')}") # For debugging
 
-        try:
-            response = requests.post(api_endpoint, headers=self.headers, json=current_payload, timeout=60) # Added timeout
+        # Content-Type: application/json is already set on the session
+        with self._session.post(self._api_endpoint, data=payload, stream=True, timeout=60) as response:
+            if not response.ok:
+                response.content  # Read the error body before the response is closed, so it can be logged
             response.raise_for_status()  # Raises an HTTPError for bad responses (4XX or 5XX)
-            
-            response_data = response.json()
-            # print(f"LLM Response Data: {json.dumps(response_data, indent=2)}") # For debugging
-
-            # Extract the answer. This depends on the API's response structure.
-            # For OpenAI-compatible APIs (like many DeepSeek models aim for):
-            if response_data.get("choices") and len(response_data["choices"]) > 0:
-                message = response_data["choices"][0].get("message")
-                if message and message.get("content"):
-                    return message["content"].strip()
-                # Fallback for some completion-style responses
-                elif response_data["choices"][0].get("text"):
-                     return response_data["choices"][0]["text"].strip()
-            
+
+            # Some servers ignore "stream" and answer with a single JSON body.
+            if response.headers.get("Content-Type", "").startswith("application/json"):
+                content = self._extract_content(_json_loads(response.content), "message")
+                if content:
+                    yield content
+                return
+
+            # Iterate raw bytes and decode as UTF-8: without a charset in the Content-Type,
+            # requests would decode text/event-stream as ISO-8859-1 and garble non-ASCII tokens.
+            for line in response.iter_lines():
+                content = self._parse_sse_line(line.decode('utf-8'))
+                if content is None:
+                    break
+                if content:
+                    yield content
+
+    async def generate_answer_async(self, query: str, context: str, max_tokens: int = 500, temperature: float = 0.7) -> Optional[str]:
+        """
+        Async version of generate_answer, for serving many queries concurrently from one event loop.
+
+        Requires httpx. Connections are pooled in a client shared by all instances.
+
+        Args:
+            query: The user's original query.
+            context: The retrieved context from the vector store.
+            max_tokens: Maximum number of tokens for the generated answer.
+            temperature: Sampling temperature for generation (0.0 to 1.0+).
+
+        Returns:
+            The generated answer as a string, or None if an error occurs.
+        """
+        if not self.api_base_url:
+            print("API URL not configured.")
+            return None
+        if not HTTPX_AVAILABLE:
+            print("httpx is not installed. Install it to use the async LLM API: pip install httpx")
+            return None
+
+        payload = self._build_payload(query, context, max_tokens, temperature)
+        print(f"Sending async request to LLM: {self._api_endpoint} with model {self.model_name}")
+
+        try:
+            fragments = []
+            client = self._get_async_client()
+            async with client.stream("POST", self._api_endpoint, content=payload, headers=self.headers) as response:
+                if response.is_error:
+                    await response.aread()  # Load the error body so it can be logged
+                response.raise_for_status()
+
+                # Some servers ignore "stream" and answer with a single JSON body.
+                if response.headers.get("Content-Type", "").startswith("application/json"):
+                    content = self._extract_content(_json_loads(await response.aread()), "message")
+                    fragments.append(content or "")
+                else:
+                    async for line in response.aiter_lines():
+                        content = self._parse_sse_line(line)
+                        if content is None:
+                            break
+                        fragments.append(content)
+
+            answer = "".join(fragments).strip()
+            if answer:
+                return answer
             print("Could not extract answer from LLM response.")
-            print(f"Full response: {response_data}")
             return "Sorry, I received a response but could not extract an answer."
-
-        except requests.exceptions.RequestException as e:
-            print(f"Error calling LLM API: {e}")
-            if hasattr(e, 'response') and e.response is not None:
-                try:
-                    print(f"Response content: {e.response.text}")
-                except Exception:
-                    pass # Ignore if response content is not available or not text
+        except httpx.HTTPError as e:
+            self._log_request_error(e)
             return "Sorry, I encountered an error while trying to reach the language model."
         except Exception as e:
             print(f"An unexpected error occurred during LLM call: {e}")
             return "Sorry, an unexpected error occurred while processing your request with the language model."
 
+    async def generate_answers_batch(self, queries_with_context: List[Tuple[str, str]],
+                                     max_tokens: int = 500, temperature: float = 0.7) -> List[Optional[str]]:
+        """
+        Generates answers for several (query, context) pairs concurrently.
+
+        Args:
+            queries_with_context: A list of (query, context) pairs.
+            max_tokens: Maximum number of tokens for each generated answer.
+            temperature: Sampling temperature for generation (0.0 to 1.0+).
+
+        Returns:
+            The answers, in the same order as the input pairs.
+        """
+        return await asyncio.gather(*[
+            self.generate_answer_async(query, context, max_tokens, temperature)
+            for query, context in queries_with_context
+        ])
+
+    @classmethod
+    def _get_async_client(cls) -> "httpx.AsyncClient":
+        """Returns the shared async client for the running event loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        client = cls._async_clients.get(loop)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+                timeout=60,
+            )
+            with cls._async_clients_lock:
+                # Clients of loops closed without aclose() can no longer be closed, and their open
+                # connections keep the loop alive; drop them so both can be garbage collected.
+                for stale_loop in [l for l in cls._async_clients.keys() if l.is_closed()]:
+                    del cls._async_clients[stale_loop]
+                cls._async_clients[loop] = client
+        return client
+
+    @classmethod
+    async def aclose(cls) -> None:
+        """
+        Closes the running event loop's async client and its connections. The next async request on
+        this loop creates a new client; clients of other loops are not affected.
+
+        Await this before the event loop that made the requests ends, e.g. at the end of the
+        coroutine passed to asyncio.run().
+        """
+        with cls._async_clients_lock:
+            client = cls._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.aclose()
+
+    @staticmethod
+    def _parse_sse_line(line: str) -> Optional[str]:
+        """
+        Parses one server-sent events line of a streamed response.
+
+        Each chunk arrives as a 'data: {...}' line and the stream ends with 'data: [DONE]'.
+
+        Returns:
+            The content fragment ('' for lines without content), or None at the end of the stream.
+        """
+        if not line.startswith("data:"):
+            return ""
+        data = line[len("data:"):].strip()
+        if data == "[DONE]":
+            return None
+        return LLMIntegrator._extract_content(_json_loads(data), "delta") or ""
+
+    @staticmethod
+    def _extract_content(response_data: Dict[str, Any], message_key: str) -> Optional[str]:
+        """
+        Extracts the generated text from a response or stream chunk.
+
+        This depends on the API's response structure. For OpenAI-compatible APIs (like many DeepSeek
+        models aim for) the text is in choices[0][message_key]["content"], where message_key is
+        "message" for full responses and "delta" for stream chunks.
+        """
+        choices = response_data.get("choices")
+        if not choices:
+            return None
+        message = choices[0].get(message_key)
+        if message and message.get("content"):
+            return message["content"]
+        # Fallback for some completion-style responses
+        return choices[0].get("text")
+
+    @staticmethod
+    def _log_request_error(e: Exception) -> None:
+        """Logs a failed LLM request (requests or httpx error), including the response body if there is one."""
+        print(f"Error calling LLM API: {e}")
+        if hasattr(e, 'response') and e.response is not None:
+            try:
+                print(f"Response content: {e.response.text}")
+            except Exception:
+                pass # Ignore if response content is not available or not text
+
 # Example Usage (requires DEEPSEEK_API_BASE_URL and DEEPSEEK_API_KEY environment variables to be set)
 if __name__ == '__main__':
     # IMPORTANT: Set your actual API base URL and Key as environment variables or pass them directly.
@@ -147,6 +375,23 @@ if __name__ == '__main__':
         else:
             print("\nFailed to get an answer from LLM.")
 
+        # Streaming: print fragments as they arrive
+        print("\nStreaming LLM Answer:")
+        for fragment in llm_client.generate_answer_stream(sample_query, sample_context):
+            print(fragment, end="", flush=True)
+        print()
+
+        # Async: answer several queries concurrently, then close the shared client
+        if HTTPX_AVAILABLE:
+            async def _batch_example():
+                try:
+                    return await llm_client.generate_answers_batch([(sample_query, sample_context)] * 3)
+                finally:
+                    await LLMIntegrator.aclose()
+
+            for i, batch_answer in enumerate(asyncio.run(_batch_example()), 1):
+                print(f"\nBatch Answer {i}:\n{batch_answer}")
+
         # Example without context (if the model supports direct Q&A)
         # print("\nSending query to LLM: '{sample_query}' without context.")
         # answer_no_context = llm_client.generate_answer(sample_query, "") # Empty context
@@ -0,0 +1,85 @@
+import functools
+import hashlib
+import os
+from typing import Callable, Dict, Optional
+
+# Optional persistent cache backend
+try:
+    import diskcache
+    DISKCACHE_AVAILABLE = True
+except ImportError:
+    DISKCACHE_AVAILABLE = False
+
+# Optional fast non-cryptographic hash for cache keys; blake2b is used otherwise
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+# Cache location, overridable via the IQA_CACHE_DIR environment variable.
+# Set IQA_DISABLE_CACHE=1 to turn disk caching off.
+CACHE_DIR = os.getenv("IQA_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "iqa"))
+
+# Texts shorter than this are cheaper to recompute than to hash and look up
+_MIN_CACHED_LENGTH = 1024
+
+# namespace -> cache, or None if the cache could not be opened (it is not retried)
+_caches: Dict[str, Optional["diskcache.Cache"]] = {}
+_MISSING = object()
+
+
+def get_cache(namespace: str) -> Optional["diskcache.Cache"]:
+    """Returns the disk cache for a namespace, or None if caching is unavailable, disabled or failed to open."""
+    if not DISKCACHE_AVAILABLE or os.getenv("IQA_DISABLE_CACHE"):
+        return None
+    if namespace not in _caches:
+        try:
+            _caches[namespace] = diskcache.Cache(os.path.join(CACHE_DIR, namespace))
+        except Exception as e:
+            # e.g. an unwritable cache directory; caching is only a speedup, so carry on without it
+            print(f"Warning: disk cache '{namespace}' unavailable, continuing without it: {e}")
+            _caches[namespace] = None
+    return _caches[namespace]
+
+
+def content_hash(data: bytes) -> str:
+    """Returns a hex digest identifying data (xxh3-128 when available, blake2b otherwise)."""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_128(data).hexdigest()
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def disk_cached(namespace: str, version: int) -> Callable:
+    """
+    Caches the result of a method taking a single text argument on disk, keyed by the text's content hash.
+
+    The instance must provide a _cache_params() method returning a hashable, repr-stable tuple of the
+    parameters that affect the result, or None if the result cannot be cached (e.g. a custom callable
+    is involved). Bump version whenever the method's output changes for the same input.
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        def wrapper(self, text: str):
+            if not isinstance(text, str) or len(text) < _MIN_CACHED_LENGTH:
+                return method(self, text)
+            cache = get_cache(namespace)
+            params = self._cache_params() if cache is not None else None
+            if params is None:
+                return method(self, text)
+
+            key = f"{content_hash(text.encode('utf-8', 'surrogatepass'))}:{version}:{params!r}"
+            # Cache errors (e.g. a read-only directory or a sqlite timeout) fall back to computing the result
+            try:
+                result = cache.get(key, default=_MISSING)
+            except Exception:
+                result = _MISSING
+            if result is _MISSING:
+                result = method(self, text)
+                try:
+                    cache.set(key, result)
+                except Exception:
+                    pass
+            return result
+        return wrapper
+    return decorator